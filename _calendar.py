@@ -3,13 +3,14 @@ import numpy as np
 import streamlit as st
 from streamlit_calendar import calendar
 from pandas import DataFrame
+from _config import Config
 
 
-def get_calendar_events(events: DataFrame, config: dict) -> list[dict]:
+def get_calendar_events(events: DataFrame, config: Config) -> list[dict]:
     """
     Convert a pd.DataFrame with events to a list with calendar events
     :param events: Table with events in rows and event specific data in columns
-    :param config: Dict with room color and room notation
+    :param config: Config with room color and room notation
     :return: list[dict]
     """
     calendar_events = []
@@ -18,13 +19,14 @@ def get_calendar_events(events: DataFrame, config: dict) -> list[dict]:
         event.fillna("", inplace=True)
 
         # build event dict
+        room = config.rooms[event.room]
         calendar_event = {
             "title": event.title,
             "start": event.setup_start,
             "end": event.teardown_end,
-            "resourceId": str(config["resourceOrder"][event.room]) + event.room,
-            "backgroundColor": config["resourceColor"][event.room],
-            "borderColor": config["resourceColor"][event.room]
+            "resourceId": room.resource_id,
+            "backgroundColor": room.color,
+            "borderColor": room.color
         }
 
         # delete already used information
@@ -37,7 +39,7 @@ def get_calendar_events(events: DataFrame, config: dict) -> list[dict]:
             calendar_event["borderColor"] = "red"
 
         # check if event requires personal
-        event_positions = event[config["available_positions"]]
+        event_positions = event[config.available_positions]
         not_required_positions = event_positions.isin(["-"])
         if np.all(not_required_positions):
             # overwrite background color if event doesn't require personal
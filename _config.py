@@ -0,0 +1,210 @@
+import copy
+import json
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+import streamlit as st
+from pandas import DataFrame, Index
+
+
+class Room(NamedTuple):
+    """
+    Precomputed calendar information of a single room
+    """
+    resource_id: str  # calendar resource id, e.g. "1MS"
+    color: str  # background and border color of events in this room
+    name: str  # human readable room name
+
+
+@dataclass(frozen=True, eq=False)
+class Config:
+    """
+    Validated, read only representation of config.json
+    """
+    editable: bool
+    query_lock: Mapping[str, str]
+    _calendar_options: dict = field(repr=False)  # private, use calendar_options
+    rooms: Mapping[str, Room]  # room notation -> Room
+    event_tags: tuple[tuple[str, str], ...]  # (tag column, displayed label)
+    tag_columns: tuple[str, ...]
+    available_positions: Index  # immutable, can be used directly to index events
+    crew_members: tuple[str, ...]  # keeps order of config for dropdown menus
+    crew_member_set: frozenset[str]
+
+    @property
+    def calendar_options(self) -> dict:
+        """
+        streamlit-calendar compatible options, copied on every access so the shared config can't be modified
+        :return: dict with all calendar options
+        """
+        return copy.deepcopy(self._calendar_options)
+
+    def validate_event_table(self, event_table: DataFrame) -> None:
+        """
+        Checks that every room and column used by the event table is known to the config
+        :param event_table: Table with events in rows and event specific data in columns
+        :return: None
+        :raises ValueError: if the event table does not match the config
+        """
+        errors = []
+
+        required_columns = ["room", *self.tag_columns, *self.available_positions]
+        missing_columns = [column for column in required_columns if column not in event_table.columns]
+        if missing_columns:
+            errors.append(f"missing columns in event table: {', '.join(missing_columns)}")
+
+        if "room" in event_table.columns:
+            missing_rooms = event_table["room"].isna() | (event_table["room"] == "")
+            if missing_rooms.any():
+                errors.append(f"events without room in rows: {', '.join(map(str, event_table.index[missing_rooms]))}")
+
+            unknown_rooms = set(event_table["room"][~missing_rooms]) - self.rooms.keys()
+            if unknown_rooms:
+                errors.append(f"rooms not defined in config: {', '.join(sorted(map(str, unknown_rooms)))}")
+
+        if errors:
+            raise ValueError("; ".join(errors))
+
+
+def _require_keys(raw_config: dict, keys: list[str], errors: list[str]) -> None:
+    """
+    Appends an error message for every key missing in the raw config
+    :param raw_config: config as loaded from json
+    :param keys: required keys
+    :param errors: list of error messages to append to
+    :return: None
+    """
+    for key in keys:
+        if key not in raw_config:
+            errors.append(f"missing key '{key}'")
+
+
+def _require_types(raw_config: dict, types: dict[str, type], errors: list[str]) -> None:
+    """
+    Appends an error message for every value in the raw config that has not the expected type
+    :param raw_config: config as loaded from json
+    :param types: expected type of every key
+    :param errors: list of error messages to append to
+    :return: None
+    """
+    for key, expected_type in types.items():
+        if not isinstance(raw_config[key], expected_type):
+            errors.append(f"'{key}' must be a {expected_type.__name__}, not {type(raw_config[key]).__name__}")
+
+
+def _require_string_items(raw_config: dict, keys: list[str], errors: list[str]) -> None:
+    """
+    Appends an error message for every list item or dict value in the raw config that is not a string
+    :param raw_config: config as loaded from json
+    :param keys: keys of lists or dicts that may only contain strings
+    :param errors: list of error messages to append to
+    :return: None
+    """
+    for key in keys:
+        items = raw_config[key].values() if isinstance(raw_config[key], dict) else raw_config[key]
+        for item in items:
+            if not isinstance(item, str):
+                errors.append(f"'{key}' may only contain strings, not {item!r}")
+
+
+def build_config(raw_config: dict) -> Config:
+    """
+    Validates a raw config dict and precomputes all lookups
+    :param raw_config: config as loaded from json
+    :return: Config
+    :raises ValueError: if the config is incomplete or inconsistent
+    """
+    if not isinstance(raw_config, dict):
+        raise ValueError(f"invalid config: must be a json object, not {type(raw_config).__name__}")
+
+    errors = []
+    _require_keys(
+        raw_config,
+        ["editable", "query_lock", "resourceColor", "resourceName", "resourceOrder", "calendarOptions",
+         "event_tags", "available_positions", "crew_members"],
+        errors
+    )
+    if errors:
+        raise ValueError(f"invalid config: {'; '.join(errors)}")
+
+    _require_types(
+        raw_config,
+        {"editable": bool, "query_lock": dict, "resourceColor": dict, "resourceName": dict, "resourceOrder": dict,
+         "calendarOptions": dict, "event_tags": list, "available_positions": list, "crew_members": list},
+        errors
+    )
+    if errors:
+        raise ValueError(f"invalid config: {'; '.join(errors)}")
+
+    _require_string_items(
+        raw_config,
+        ["query_lock", "resourceColor", "resourceName", "available_positions", "crew_members"],
+        errors
+    )
+    for room, order in raw_config["resourceOrder"].items():
+        if not isinstance(order, int) or isinstance(order, bool):
+            errors.append(f"order of room '{room}' in 'resourceOrder' must be an integer, not {order!r}")
+
+    # every room needs an order, a color and a name
+    resource_order = raw_config["resourceOrder"]
+    resource_color = raw_config["resourceColor"]
+    resource_name = raw_config["resourceName"]
+    for room in sorted(set(resource_order) | set(resource_color) | set(resource_name)):
+        for field_name, room_field in (("resourceOrder", resource_order),
+                                  ("resourceColor", resource_color),
+                                  ("resourceName", resource_name)):
+            if room not in room_field:
+                errors.append(f"room '{room}' missing in '{field_name}'")
+
+    for tag in raw_config["event_tags"]:
+        if not isinstance(tag, list) or len(tag) != 2 or not all(isinstance(part, str) for part in tag):
+            errors.append(f"event tag {tag!r} is not a pair of strings [column, label]")
+
+    if errors:
+        raise ValueError(f"invalid config: {'; '.join(errors)}")
+
+    rooms = {
+        room: Room(
+            resource_id=str(resource_order[room]) + room,
+            color=resource_color[room],
+            name=resource_name[room]
+        )
+        for room in resource_order
+    }
+    event_tags = tuple((tag[0], tag[1]) for tag in raw_config["event_tags"])
+    crew_members = tuple(raw_config["crew_members"])
+
+    return Config(
+        editable=raw_config["editable"],
+        query_lock=MappingProxyType(dict(raw_config["query_lock"])),
+        _calendar_options=copy.deepcopy(raw_config["calendarOptions"]),
+        rooms=MappingProxyType(rooms),
+        event_tags=event_tags,
+        tag_columns=tuple(tag[0] for tag in event_tags),
+        available_positions=Index(raw_config["available_positions"]),
+        crew_members=crew_members,
+        crew_member_set=frozenset(crew_members)
+    )
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_config(path: str, mtime: float) -> Config:
+    """
+    Reads and compiles the config file, cached for all sessions until the modification time changes
+    :param path: path to the config file
+    :param mtime: modification time of the config file, only used as cache key
+    :return: Config
+    """
+    with open(path, "rt") as fh:
+        return build_config(json.load(fh))
+
+
+def get_config(path: str = "config.json") -> Config:
+    """
+    Returns the compiled config shared by all sessions, reloads it only if the file was modified
+    :param path: path to the config file
+    :return: Config
+    """
+    return _load_config(path, os.path.getmtime(path))
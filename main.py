@@ -2,8 +2,8 @@ import streamlit as st
 from streamlit import session_state as ss
 import pandas as pd
 import numpy as np
-import json
 from _calendar import get_calendar_events, calendar_ui
+from _config import get_config
 from datetime import datetime
 
 
@@ -13,6 +13,17 @@ def update_event_table():
     # read recent event table
     new_event_table = pd.read_excel("events.xlsx")
 
+    try:
+        # reject event tables with rooms or tags unknown to the config
+        ss.config.validate_event_table(new_event_table)
+    except ValueError as e:
+        # keep the old event table, but remember that the file on disk must not be overwritten
+        ss.event_table_rejected = True
+        st.error(f"Event table does not match config: {e}")
+        return
+
+    ss.event_table_rejected = False
+
     needs_update = False  # there is a change in the event table
     needs_rerun = False  # the user is looking at outdated information -> rerun
 
@@ -56,7 +67,7 @@ def show_locked_badge() -> None:
     Shows a badge with "Locked" if "editable" is set to false in config
     :return: None
     """
-    if not ss.config["editable"]:
+    if not ss.config.editable:
         # schedule has been locked
         st.badge("Locked", icon="⛔️", color="primary")
 
@@ -67,7 +78,7 @@ def show_calendar() -> dict:
     :return: selected calendar event as dict
     """
     events = get_calendar_events(ss.event_table, ss.config)
-    selection = calendar_ui(events, ss.config["calendarOptions"])
+    selection = calendar_ui(events, ss.config.calendar_options)
 
     cal_capt_col1, _, cal_capt_col2 = st.columns([4, 1, 3])
 
@@ -112,7 +123,7 @@ def show_event_header(event: pd.Series, short: bool = False) -> None:
 
     if short:
         # display two line form
-        room_name = ss.config["resourceName"][event.room]
+        room_name = ss.config.rooms[event.room].name
         if event.subtitle is not np.nan:
             # show subtitle if available
             second_line_text = (f'{event.subtitle} <font color="#a3a3a4">by {event.host} '
@@ -126,7 +137,7 @@ def show_event_header(event: pd.Series, short: bool = False) -> None:
             # show subtitle if available
             st.subheader(event.subtitle)
 
-        room_name = ss.config["resourceName"][event.room]
+        room_name = ss.config.rooms[event.room].name
         st.caption(f"by {event.host} ({formated_contact_info}) at {room_name}")
 
 
@@ -159,7 +170,7 @@ def build_interactive_dataframe(event: pd.Series, event_index: int) -> tuple[pd.
     :return: tuple of (pd.Dataframe with available positions and assigned crew members, column config dict)
     """
     # build pd.Dataframe from positions and names
-    positions = ss.config["available_positions"]  # required columns of event table
+    positions = ss.config.available_positions  # required columns of event table
     col_config = {}  # columns of dataframe
     assigned_crew_member = {}  # values of dataframe
     for position in positions:
@@ -175,8 +186,8 @@ def build_interactive_dataframe(event: pd.Series, event_index: int) -> tuple[pd.
             # interactive dropdown menu
             col_config[position] = st.column_config.SelectboxColumn(
                 position,
-                options=ss.config["crew_members"],  # list of crew members
-                disabled=not ss.config["editable"]  # locks table if set in config
+                options=ss.config.crew_members,  # list of crew members
+                disabled=not ss.config.editable  # locks table if set in config
             )
 
     # build dataframe
@@ -199,11 +210,15 @@ def save_to_event_table(new_crew_positions: pd.DataFrame, event_index: int) -> N
     # reload recent event table
     update_event_table()
 
+    if ss.event_table_rejected:
+        # event table file is invalid, don't overwrite it with the outdated event table
+        return
+
     # format positions as list
     replacement_data = new_crew_positions.iloc[0].tolist()
 
     # merge into event table
-    positions = ss.config["available_positions"]
+    positions = ss.config.available_positions
     ss.event_table.loc[event_index, positions] = replacement_data
 
     # save to file
@@ -277,11 +292,11 @@ def build_tags_string(event: pd.Series) -> str:
     """
     tags_text_body = ""  # build string with formated tags
 
-    for tag in ss.config["event_tags"]:
+    for tag_column, tag_label in ss.config.event_tags:
         # check every possible tag
-        if event[tag[0]]:
+        if event[tag_column]:
             # add tag to the string
-            tags_text_body += f"{tag[1]}<br>"
+            tags_text_body += f"{tag_label}<br>"
 
     return tags_text_body
 
@@ -394,7 +409,7 @@ def show_open_shifts_event_cell(event: pd.Series, show_open_positions: bool, exp
 
         with crew_position_col:
             # build pd.Dataframe from positions and names
-            positions = ss.config["available_positions"]  # required columns of event table
+            positions = ss.config.available_positions  # required columns of event table
             assigned_crew_member = []  # values of dataframe
             for position in positions:
                 # transfer crew shifts of this event from event table
@@ -445,12 +460,15 @@ def show_open_shifts_tab() -> None:
 
     sorted_event_table = ss.event_table.sort_values(by="setup_start")
 
+    # get all available positions
+    positions = ss.config.available_positions
+
     # iterate through events
     total_open_positions = 0
     total_existing_positions = 0
     last_printed_day = ""
     for event_index, event in sorted_event_table.iterrows():
-        event_positions = event[ss.config["available_positions"]]
+        event_positions = event[positions]
 
         # get open positions of the event
         open_positions = event_positions.isin([np.nan])
@@ -458,7 +476,7 @@ def show_open_shifts_tab() -> None:
         num_of_open_positions = np.sum(open_positions)
 
         # get over all positions of the event
-        existing_positions = event_positions.isin([np.nan] + ss.config["crew_members"])
+        existing_positions = event_positions.isna() | event_positions.isin(ss.config.crew_member_set)
         num_of_existing_positions = np.sum(existing_positions)
 
         # count open and general positions of all events
@@ -487,7 +505,7 @@ def show_open_shifts_tab() -> None:
 def show_your_shifts_tab() -> None:
     selected_crew_members = st.multiselect(
         label="Shown Crew Member",
-        options=ss.config["crew_members"],
+        options=ss.config.crew_members,
         placeholder="Select your name",
         label_visibility="collapsed"
     )
@@ -506,7 +524,7 @@ def show_your_shifts_tab() -> None:
     sorted_event_table = ss.event_table.sort_values(by="setup_start")
 
     # get all available positions
-    positions = ss.config["available_positions"]
+    positions = ss.config.available_positions
 
     # search all events
     found_events = []
@@ -547,20 +565,31 @@ def show_all_data_tab() -> None:
 st.set_page_config(page_icon="🐾")
 
 
-# load config for the first time
-if "config" not in ss:
-    with open("config.json", "rt") as fh:
-        ss.config = json.load(fh)
+try:
+    # get config shared by all sessions (reloaded only if config.json was modified)
+    ss.config = get_config()
+except ValueError as e:
+    st.error(f"config.json could not be loaded: {e}")
+    st.stop()
 
-if ss.config["query_lock"]:
+if ss.config.query_lock:
     # limit access if defined in config
-    for query_key, value in ss.config["query_lock"].items():
+    for query_key, value in ss.config.query_lock.items():
         query_lock(query_key, value, "Forbidden")
 
 # load event table for the first time
 if "event_table" not in ss:
     ss.event_table = pd.read_excel("events.xlsx")
 
+try:
+    # make sure every room and tag of the event table is known to the config
+    ss.config.validate_event_table(ss.event_table)
+except ValueError as e:
+    # forget the rejected event table, so a fixed file is read again on the next rerun
+    del ss.event_table
+    st.error(f"Event table does not match config: {e}")
+    st.stop()
+
 
 st.logo("Logo-1-Color-B.png", size="large", link="https://awoostria.at/")
 